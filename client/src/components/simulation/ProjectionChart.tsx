@@ -33,6 +33,12 @@ export function ProjectionChart({
     return null;
   }
 
+  // The API sends a bare value array; months are implicit (1..n)
+  const chartData = (result.trajectory?.values ?? []).map((value, i) => ({
+    month: i + 1,
+    value,
+  }));
+
   return (
     <Card>
       <CardHeader>
@@ -42,7 +48,7 @@ export function ProjectionChart({
       <CardContent>
         <div className="h-80">
           <ResponsiveContainer width="100%" height="100%">
-            <LineChart data={result?.trajectory ?? []}>
+            <LineChart data={chartData}>
               <CartesianGrid strokeDasharray="3 3" />
               <XAxis dataKey="month" />
               <YAxis />
@@ -10,7 +10,7 @@ export interface SimulationResult {
   net_profit_after_tax: number;
   tax_paid: number;
   total_contributed: number;
-  trajectory?: Array<{ month: number; value: number }>;
+  trajectory?: { values: number[] };
   // Monte Carlo specific fields
   assumed_annual_vol?: number;
   n_paths?: number;
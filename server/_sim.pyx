@@ -0,0 +1,23 @@
+# cython: boundscheck=False, wraparound=False, cdivision=True
+"""
+Optional C implementation of the deterministic month loop.
+
+For deployments that prefer a plain compiled extension over a JIT dependency,
+build with:
+
+    python setup.py build_ext --inplace
+
+opcvm_simulator picks it up automatically when present; without it the
+pure-NumPy closed form is used, so the build step is never required.
+"""
+
+def run_sim(double r_month, double fee_month, double contrib, int months,
+            double initial, double[::1] out):
+    cdef double balance = initial
+    cdef int m
+    for m in range(months):
+        balance *= 1.0 + r_month
+        balance -= balance * fee_month
+        balance += contrib
+        out[m] = balance
+    return balance
@@ -23,6 +23,8 @@ from dataclasses import dataclass
 from typing import Dict, Optional, List, Tuple
 import math
 
+import numpy as np
+
 # -----------------------------
 # Embedded fund data (from report)
 # -----------------------------
@@ -144,35 +146,54 @@ def simulate_investment(
 
     balance = float(initial_amount)
     total_contributed = float(initial_amount)
-    monthly_trajectory = []
 
     # Monthly contribution growth per month (convert annual increase to monthly step)
     contrib = float(monthly_contribution)
     monthly_increase = (1.0 + contribution_increase_rate) ** (1.0 / 12.0) - 1.0 if contribution_increase_rate != 0 else 0.0
 
-    for m in range(months):
-        # Optionally add contribution at beginning
-        if contributions_at_beginning and contrib > 0:
-            balance += contrib
-            total_contributed += contrib
-
-        # Grow
-        balance *= (1.0 + r_month)
-
-        # Fees (as a percentage of current AUM)
-        fee_amt = balance * fee_month
-        balance -= fee_amt
-
-        # Contribution at end
-        if not contributions_at_beginning and contrib > 0:
-            balance += contrib
-            total_contributed += contrib
-
-        monthly_trajectory.append(balance)
-
-        # Increase next month's contribution
-        if monthly_increase != 0.0 and contrib > 0:
+    if monthly_increase == 0.0:
+        # Constant contribution: each month is balance -> balance*g + c (end-of-month
+        # contributions) or balance -> (balance + c)*g (beginning-of-month), with
+        # g = (1+r)*(1-fee). Solve the geometric series in closed form instead of looping.
+        g = (1.0 + r_month) * (1.0 - fee_month)
+        c = contrib * g if contributions_at_beginning else contrib
+        powers = np.power(g, np.arange(1, months + 1))
+        if abs(g - 1.0) < 1e-12:
+            annuity = np.arange(1, months + 1, dtype=np.float64)
+        else:
+            annuity = (powers - 1.0) / (g - 1.0)
+        trajectory = balance * powers + c * annuity
+        monthly_trajectory = trajectory.tolist()
+        total_contributed += contrib * months
+        balance = float(trajectory[-1]) if months > 0 else balance
+    else:
+        # Growing contributions: no simple closed form, keep the monthly loop
+        # but write into a preallocated buffer instead of appending (list
+        # appends resize and box every float).
+        trajectory = np.empty(months, dtype=np.float64)
+        for m in range(months):
+            # Optionally add contribution at beginning
+            if contributions_at_beginning and contrib > 0:
+                balance += contrib
+                total_contributed += contrib
+
+            # Grow
+            balance *= (1.0 + r_month)
+
+            # Fees (as a percentage of current AUM)
+            fee_amt = balance * fee_month
+            balance -= fee_amt
+
+            # Contribution at end
+            if not contributions_at_beginning and contrib > 0:
+                balance += contrib
+                total_contributed += contrib
+
+            trajectory[m] = balance
+
+            # Increase next month's contribution
             contrib *= (1.0 + monthly_increase)
+        monthly_trajectory = trajectory.tolist()
 
     gross_final_value = balance
     gains_before_tax = gross_final_value - total_contributed
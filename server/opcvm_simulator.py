@@ -12,9 +12,23 @@ Features:
 
 from __future__ import annotations
 from dataclasses import dataclass
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from functools import lru_cache
 from typing import Optional, List, Tuple
 import math
+import multiprocessing
+import os
+import threading
 import numpy as np
+from numba import njit, prange, set_num_threads
+
+# Optional compiled month loop for deployments that prefer a plain C extension
+# over a JIT dependency; built via `python setup.py build_ext --inplace`
+# (see _sim.pyx). Absent, the NumPy closed form is used.
+try:
+    import _sim
+except ImportError:
+    _sim = None
 
 # -----------------------------
 # Fund data (from Wafa Gestion Weekly Report Aug 15, 2025)
@@ -58,18 +72,29 @@ DEFAULT_VOL_BY_CATEGORY = {
 # -----------------------------
 # Helpers
 # -----------------------------
+# Explicit signatures compile these at import (from the on-disk cache after the
+# first run), so no call ever pays JIT warmup.
+@njit("f8(f8, f8)", cache=True)
 def _cagr_from_cumulative(cum_return: float, horizon_years: float) -> float:
     return (1.0 + cum_return) ** (1.0 / horizon_years) - 1.0
 
+@njit("f8(f8)", cache=True)
 def _monthly_rate_from_annual(annual_rate: float) -> float:
     return (1.0 + annual_rate) ** (1.0 / 12.0) - 1.0
 
+# Structure-of-arrays view of FUND_DATA, built once at import so lookups in the
+# simulation hot paths are a single array index instead of nested dict walks.
+_NAMES = np.array(list(FUND_DATA))
+_CATEGORY = np.array([d["category"] for d in FUND_DATA.values()])
+_HORIZON = np.array([d["horizon_years"] for d in FUND_DATA.values()])
+_CUM_RET = np.array([d["cum_return"] for d in FUND_DATA.values()])
+_CAGR = (1.0 + _CUM_RET) ** (1.0 / _HORIZON) - 1.0
+_TAX = np.array([DEFAULT_TAX_BY_CATEGORY[d["category"]] for d in FUND_DATA.values()])
+_VOL = np.array([DEFAULT_VOL_BY_CATEGORY[d["category"]] for d in FUND_DATA.values()])
+_IDX = {name: i for i, name in enumerate(FUND_DATA)}
+
 def list_funds() -> List[Tuple[str, str, float]]:
-    items = []
-    for name, d in FUND_DATA.items():
-        cagr = _cagr_from_cumulative(d["cum_return"], d["horizon_years"])
-        items.append((name, d["category"], cagr))
-    return sorted(items)
+    return sorted(zip(_NAMES.tolist(), _CATEGORY.tolist(), _CAGR.tolist()))
 
 # -----------------------------
 # Deterministic Simulation
@@ -90,7 +115,7 @@ class SimulationResult:
     tax_paid: float
     net_final_value: float
     net_profit_after_tax: float
-    monthly_trajectory: list
+    monthly_trajectory: tuple
 
 def simulate_investment(
     fund_name: str,
@@ -101,22 +126,53 @@ def simulate_investment(
     tax_rate: Optional[float] = None,
     expected_return_override: Optional[float] = None,
 ) -> SimulationResult:
-    meta = FUND_DATA[fund_name]
-    category = meta["category"]
-    annual_return = expected_return_override or _cagr_from_cumulative(meta["cum_return"], meta["horizon_years"])
-    tax_rate = tax_rate if tax_rate is not None else DEFAULT_TAX_BY_CATEGORY[category]
+    i = _IDX[fund_name]
+    annual_return = expected_return_override if expected_return_override is not None else float(_CAGR[i])
+    tax_rate = tax_rate if tax_rate is not None else float(_TAX[i])
+    # Normalize the optional arguments first so identical requests share one
+    # cache entry in the memoized core.
+    return _simulate_core(fund_name, float(initial_amount), float(monthly_contribution),
+                          float(years), float(annual_fee), tax_rate, annual_return)
+
+@lru_cache(maxsize=4096)
+def _simulate_core(
+    fund_name: str,
+    initial_amount: float,
+    monthly_contribution: float,
+    years: float,
+    annual_fee: float,
+    tax_rate: float,
+    annual_return: float,
+) -> SimulationResult:
+    category = str(_CATEGORY[_IDX[fund_name]])
     months = int(round(years * 12))
     r_month = _monthly_rate_from_annual(annual_return)
     fee_month = annual_fee / 12.0
-    balance = float(initial_amount)
-    total_contributed = float(initial_amount)
-    monthly_trajectory = []
-    for _ in range(months):
-        balance *= (1.0 + r_month)
-        balance -= balance * fee_month
-        balance += monthly_contribution
-        total_contributed += monthly_contribution
-        monthly_trajectory.append(balance)
+    # Each month is balance -> balance*(1+r)*(1-fee) + contribution, i.e. a
+    # geometric series with growth factor g — solve it in closed form instead
+    # of looping month by month.
+    g = (1.0 + r_month) * (1.0 - fee_month)
+    if _sim is not None:
+        trajectory = np.empty(months, dtype=np.float64)
+        _sim.run_sim(r_month, fee_month, float(monthly_contribution), months,
+                     float(initial_amount), trajectory)
+    else:
+        # In-place ops: two buffers total instead of a fresh temporary per step.
+        powers = np.arange(1, months + 1, dtype=np.float64)
+        if abs(g - 1.0) < 1e-12:
+            # growth cancels fees: balance is just initial plus k contributions
+            trajectory = powers
+            trajectory *= monthly_contribution
+            trajectory += initial_amount
+        else:
+            np.power(g, powers, out=powers)
+            trajectory = powers - 1.0
+            trajectory *= monthly_contribution / (g - 1.0)
+            powers *= initial_amount
+            trajectory += powers
+    total_contributed = float(initial_amount) + monthly_contribution * months
+    balance = float(trajectory[-1]) if months > 0 else float(initial_amount)
+    monthly_trajectory = tuple(trajectory.tolist())  # immutable: cached results are shared
     gross_final_value = balance
     gains_before_tax = gross_final_value - total_contributed
     tax_paid = max(0.0, gains_before_tax) * tax_rate
@@ -129,6 +185,58 @@ def simulate_investment(
         net_final_value, net_profit_after_tax, monthly_trajectory
     )
 
+def simulate_investments_batch(params: List[dict]) -> List[SimulationResult]:
+    """
+    Evaluate many deterministic simulations in one vectorized pass.
+
+    Each item is a dict of simulate_investment keyword arguments. All K
+    trajectories come from a single broadcast of the closed-form formula over
+    a (K, max_months) matrix, instead of K separate calls.
+    """
+    if not params:
+        return []
+    idx = [_IDX[p["fund_name"]] for p in params]
+    annual_return = np.array([
+        p["expected_return_override"] if p.get("expected_return_override") is not None
+        else float(_CAGR[i])
+        for p, i in zip(params, idx)])
+    tax_rate = np.array([
+        p["tax_rate"] if p.get("tax_rate") is not None else float(_TAX[i])
+        for p, i in zip(params, idx)])
+    initial = np.array([float(p["initial_amount"]) for p in params])
+    contrib = np.array([float(p["monthly_contribution"]) for p in params])
+    years = np.array([float(p["years"]) for p in params])
+    fee = np.array([float(p.get("annual_fee", 0.015)) for p in params])
+
+    months = np.rint(years * 12).astype(np.int64)
+    max_m = int(months.max())
+    r_month = (1.0 + annual_return) ** (1.0 / 12.0) - 1.0
+    g = (1.0 + r_month) * (1.0 - fee / 12.0)
+    powers = g[:, None] ** np.arange(1, max_m + 1)
+    flat = np.abs(g - 1.0) < 1e-12
+    denom = np.where(flat, 1.0, g - 1.0)
+    annuity = np.where(flat[:, None],
+                       np.arange(1, max_m + 1)[None, :],
+                       (powers - 1.0) / denom[:, None])
+    trajectories = initial[:, None] * powers + contrib[:, None] * annuity
+
+    results = []
+    for j, (p, i) in enumerate(zip(params, idx)):
+        m = int(months[j])
+        trajectory = tuple(trajectories[j, :m].tolist())
+        total_contributed = float(initial[j]) + float(contrib[j]) * m
+        gross_final_value = trajectory[-1] if m > 0 else float(initial[j])
+        gains_before_tax = gross_final_value - total_contributed
+        tax_paid = max(0.0, gains_before_tax) * float(tax_rate[j])
+        net_final_value = gross_final_value - tax_paid
+        results.append(SimulationResult(
+            p["fund_name"], str(_CATEGORY[i]), float(annual_return[j]), float(fee[j]),
+            float(tax_rate[j]), float(years[j]), float(initial[j]), float(contrib[j]),
+            total_contributed, gross_final_value, gains_before_tax, tax_paid,
+            net_final_value, net_final_value - total_contributed, trajectory
+        ))
+    return results
+
 # -----------------------------
 # Monte Carlo + Risk Metrics
 # -----------------------------
@@ -157,6 +265,200 @@ class MonteCarloSummary:
     prob_loss: float
     risk: RiskMetrics
 
+@njit(cache=True, fastmath=True, inline="always")
+def _mc_step(bal, peak, worst_dd, sumsq_neg, z, drift, vol_step, fee_month, monthly_contribution):
+    prev = bal
+    bal *= math.exp(drift + vol_step * z)
+    bal -= bal * fee_month
+    ret = bal / prev - 1.0  # investment return net of fees, before contribution
+    bal += monthly_contribution
+    if ret < 0.0:
+        sumsq_neg += ret * ret
+    if bal > peak:
+        peak = bal
+    dd = 1.0 - bal / peak
+    if dd > worst_dd:
+        worst_dd = dd
+    return bal, peak, worst_dd, sumsq_neg
+
+@njit(parallel=True, cache=True, fastmath=True)
+def _mc_path_kernel(out, max_dd, downside, initial_amount, drift, vol_step, fee_month,
+                    monthly_contribution, months, seed):
+    # Fused kernel: normal draw, GBM growth, fee and contribution all happen in
+    # registers, so the (n_paths, months) Z / returns arrays never exist.
+    # Paths come in antithetic pairs (2p gets +z, 2p+1 gets -z), which roughly
+    # halves estimator variance for the same path count, and each pair seeds
+    # its own stream so results are reproducible under prange. Drawdown and
+    # downside deviation are tracked in registers, so the risk metrics cost no
+    # extra memory.
+    n_pairs = out.shape[0] // 2
+    for p in prange(n_pairs):
+        np.random.seed(seed + p)
+        bal_a = initial_amount
+        peak_a = bal_a
+        dd_a = 0.0
+        sq_a = 0.0
+        bal_b = initial_amount
+        peak_b = bal_b
+        dd_b = 0.0
+        sq_b = 0.0
+        for m in range(months):
+            z = np.random.standard_normal()
+            bal_a, peak_a, dd_a, sq_a = _mc_step(bal_a, peak_a, dd_a, sq_a, z,
+                                                 drift, vol_step, fee_month, monthly_contribution)
+            bal_b, peak_b, dd_b, sq_b = _mc_step(bal_b, peak_b, dd_b, sq_b, -z,
+                                                 drift, vol_step, fee_month, monthly_contribution)
+        i = 2 * p
+        out[i] = bal_a
+        out[i + 1] = bal_b
+        max_dd[i] = dd_a
+        max_dd[i + 1] = dd_b
+        if months > 0:
+            downside[i] = math.sqrt(sq_a / months)
+            downside[i + 1] = math.sqrt(sq_b / months)
+        else:
+            downside[i] = 0.0
+            downside[i + 1] = 0.0
+
+# Above this many paths the work is split into per-CPU chunks on a process
+# pool; each worker runs its kernel single-threaded so processes, not prange,
+# provide the parallelism and cores are not oversubscribed.
+_MC_POOL_MIN_PATHS = 20_000
+_MC_POOL = None
+
+# Reusable per-thread Generator for unseeded calls, so each request does not
+# pay OS-entropy gathering and Generator construction.
+_TLS = threading.local()
+
+def _rng() -> np.random.Generator:
+    rng = getattr(_TLS, "rng", None)
+    if rng is None:
+        rng = _TLS.rng = np.random.default_rng()
+    return rng
+
+def _mc_worker_init():
+    set_num_threads(1)
+
+def _mc_pool() -> ProcessPoolExecutor:
+    global _MC_POOL
+    if _MC_POOL is None:
+        # spawn, not fork: forking after Numba's threading layer is live can
+        # deadlock the child/parent at shutdown.
+        _MC_POOL = ProcessPoolExecutor(max_workers=os.cpu_count(),
+                                       mp_context=multiprocessing.get_context("spawn"),
+                                       initializer=_mc_worker_init)
+    return _MC_POOL
+
+def _mc_chunk(n_paths, initial_amount, drift, vol_step, fee_month, monthly_contribution, months, seed):
+    out = np.empty(n_paths, dtype=np.float32)
+    max_dd = np.empty(n_paths, dtype=np.float32)
+    downside = np.empty(n_paths, dtype=np.float32)
+    _mc_path_kernel(out, max_dd, downside, initial_amount, drift, vol_step, fee_month,
+                    monthly_contribution, months, seed)
+    return out, float(max_dd.sum()), float(downside.sum())
+
+# Above this many paths, percentiles come from a streaming P-squared estimator
+# fed chunk by chunk, so memory stays bounded by the chunk size instead of
+# holding every terminal balance at once.
+_MC_STREAM_MIN_PATHS = 500_000
+
+@njit(cache=True)
+def _p2_update_chunk(probs, heights, positions, desired, seen, chunk):
+    # One pass of the P-squared quantile algorithm (Jain & Chlamtac 1985) over
+    # a chunk, updating the 5-marker state per tracked quantile in place.
+    nq = probs.shape[0]
+    cnt = seen
+    for j in range(chunk.shape[0]):
+        x = chunk[j]
+        if cnt < 5:
+            for i in range(nq):
+                heights[i, cnt] = x
+            cnt += 1
+            if cnt == 5:
+                for i in range(nq):
+                    heights[i, :] = np.sort(heights[i, :])
+                    for t in range(5):
+                        positions[i, t] = t + 1
+                    p = probs[i]
+                    desired[i, 0] = 1.0
+                    desired[i, 1] = 1.0 + 2.0 * p
+                    desired[i, 2] = 1.0 + 4.0 * p
+                    desired[i, 3] = 3.0 + 2.0 * p
+                    desired[i, 4] = 5.0
+            continue
+        cnt += 1
+        for i in range(nq):
+            q = heights[i]
+            n = positions[i]
+            nd = desired[i]
+            p = probs[i]
+            if x < q[0]:
+                q[0] = x
+                k = 0
+            elif x >= q[4]:
+                q[4] = x
+                k = 3
+            else:
+                k = 0
+                for t in range(1, 4):
+                    if x >= q[t]:
+                        k = t
+            for t in range(k + 1, 5):
+                n[t] += 1
+            nd[1] += p / 2.0
+            nd[2] += p
+            nd[3] += (1.0 + p) / 2.0
+            nd[4] += 1.0
+            for t in range(1, 4):
+                d = nd[t] - n[t]
+                if (d >= 1.0 and n[t + 1] - n[t] > 1) or (d <= -1.0 and n[t - 1] - n[t] < -1):
+                    s = 1 if d >= 0.0 else -1
+                    qp = q[t] + s / (n[t + 1] - n[t - 1]) * (
+                        (n[t] - n[t - 1] + s) * (q[t + 1] - q[t]) / (n[t + 1] - n[t])
+                        + (n[t + 1] - n[t] - s) * (q[t] - q[t - 1]) / (n[t] - n[t - 1]))
+                    if q[t - 1] < qp < q[t + 1]:
+                        q[t] = qp
+                    else:
+                        q[t] = q[t] + s * (q[t + s] - q[t]) / (n[t + s] - n[t])
+                    n[t] += s
+    return cnt
+
+def _exact_stats(balances, total_contributed, tax_rate):
+    balances = balances.astype(np.float64)  # upcast once for tax/percentile reporting
+    gains = balances - total_contributed
+    np.clip(gains, 0, None, out=gains)
+    gains *= tax_rate
+    balances -= gains
+    # Only three order statistics are needed: np.partition is O(n) vs the
+    # full O(n log n) sort inside np.percentile.
+    n = balances.size
+    k = np.array([int(0.05 * n), n // 2, int(0.95 * n)])
+    part = np.partition(balances, k)
+    p5, p50, p95 = float(part[k[0]]), float(part[k[1]]), float(part[k[2]])
+    prob_loss = float(np.mean(balances < total_contributed))
+    return p5, p50, p95, prob_loss
+
+def _streamed_stats(futures, total_contributed, tax_rate, n_paths):
+    probs = np.array([0.05, 0.50, 0.95])
+    heights = np.zeros((3, 5))
+    positions = np.zeros((3, 5), dtype=np.int64)
+    desired = np.zeros((3, 5))
+    seen = 0
+    losses = 0
+    sum_dd = 0.0
+    sum_downside = 0.0
+    for f in as_completed(futures):
+        chunk, dd_sum, downside_sum = f.result()
+        sum_dd += dd_sum
+        sum_downside += downside_sum
+        chunk = chunk.astype(np.float64)
+        gains = chunk - total_contributed
+        chunk -= np.clip(gains, 0, None) * tax_rate
+        losses += int(np.count_nonzero(chunk < total_contributed))
+        seen = _p2_update_chunk(probs, heights, positions, desired, seen, chunk)
+    p5, p50, p95 = float(heights[0, 2]), float(heights[1, 2]), float(heights[2, 2])
+    return p5, p50, p95, losses / n_paths, sum_dd / n_paths, sum_downside / n_paths
+
 def monte_carlo_simulate(
     fund_name: str,
     initial_amount: float,
@@ -168,38 +470,85 @@ def monte_carlo_simulate(
     annual_vol_override: Optional[float] = None,
     random_seed: Optional[int] = None,
 ) -> MonteCarloSummary:
-    rng = np.random.default_rng(random_seed)
-    meta = FUND_DATA[fund_name]
-    category = meta["category"]
-    mu = expected_return_override or _cagr_from_cumulative(meta["cum_return"], meta["horizon_years"])
-    sigma = annual_vol_override if annual_vol_override else DEFAULT_VOL_BY_CATEGORY[category]
-    tax_rate = DEFAULT_TAX_BY_CATEGORY[category]
+    args = (fund_name, float(initial_amount), float(monthly_contribution), float(years),
+            float(annual_fee), int(n_paths), expected_return_override, annual_vol_override)
+    if random_seed is None:
+        # unseeded runs must stay fresh — never cache them
+        return _monte_carlo_core(*args, None)
+    return _mc_summary_cached(*args, int(random_seed))
+
+def _monte_carlo_core(
+    fund_name: str,
+    initial_amount: float,
+    monthly_contribution: float,
+    years: float,
+    annual_fee: float,
+    n_paths: int,
+    expected_return_override: Optional[float],
+    annual_vol_override: Optional[float],
+    random_seed: Optional[int],
+) -> MonteCarloSummary:
+    if random_seed is not None:
+        ss = np.random.SeedSequence(random_seed)
+    else:
+        ss = np.random.SeedSequence(int(_rng().integers(0, 2**63 - 1)))
+    i = _IDX[fund_name]
+    category = str(_CATEGORY[i])
+    mu = expected_return_override if expected_return_override is not None else float(_CAGR[i])
+    sigma = annual_vol_override if annual_vol_override is not None else float(_VOL[i])
+    tax_rate = float(_TAX[i])
     months = int(years * 12)
     dt = 1/12
     drift = (mu - 0.5 * sigma**2) * dt
     vol_step = sigma * math.sqrt(dt)
-    Z = rng.standard_normal((n_paths, months))
-    monthly_returns = np.exp(drift + vol_step * Z) - 1
-    balances = np.full(n_paths, initial_amount)
+    fee_month = annual_fee / 12.0
     total_contributed = initial_amount + monthly_contribution * months
-    for m in range(months):
-        balances *= (1 + monthly_returns[:, m])
-        balances -= balances * (annual_fee/12)
-        balances += monthly_contribution
-    gains = balances - total_contributed
-    balances -= np.clip(gains, 0, None) * tax_rate
-    p5, p50, p95 = np.percentile(balances, [5, 50, 95])
-    prob_loss = np.mean(balances < total_contributed)
+    n_paths = int(n_paths) + (int(n_paths) & 1)  # antithetic pairs need an even count
+    if n_paths >= _MC_POOL_MIN_PATHS:
+        nchunks = os.cpu_count() or 1
+        # split whole pairs so every chunk keeps its antithetic structure
+        base, rem = divmod(n_paths // 2, nchunks)
+        sizes = [2 * (base + (1 if j < rem else 0)) for j in range(nchunks)]
+        seeds = [int(child.generate_state(1)[0] % 2**31) for child in ss.spawn(nchunks)]
+        futures = [_mc_pool().submit(_mc_chunk, size, float(initial_amount), drift, vol_step,
+                                     fee_month, float(monthly_contribution), months, chunk_seed)
+                   for size, chunk_seed in zip(sizes, seeds)]
+        if n_paths > _MC_STREAM_MIN_PATHS:
+            p5, p50, p95, prob_loss, mean_dd, mean_downside = _streamed_stats(
+                futures, total_contributed, tax_rate, n_paths)
+        else:
+            chunks = [f.result() for f in futures]
+            balances = np.concatenate([c[0] for c in chunks])
+            mean_dd = sum(c[1] for c in chunks) / n_paths
+            mean_downside = sum(c[2] for c in chunks) / n_paths
+            p5, p50, p95, prob_loss = _exact_stats(balances, total_contributed, tax_rate)
+    else:
+        seed = int(ss.generate_state(1)[0] % 2**31)
+        # float32 state halves memory traffic; model error (vol/fee uncertainty)
+        # dwarfs the precision loss for a financial projection.
+        balances = np.empty(n_paths, dtype=np.float32)
+        max_dd = np.empty(n_paths, dtype=np.float32)
+        downside = np.empty(n_paths, dtype=np.float32)
+        _mc_path_kernel(balances, max_dd, downside, float(initial_amount), drift, vol_step,
+                        fee_month, float(monthly_contribution), months, seed)
+        mean_dd = float(max_dd.mean())
+        mean_downside = float(downside.mean())
+        p5, p50, p95, prob_loss = _exact_stats(balances, total_contributed, tax_rate)
+    downside_ann = mean_downside * math.sqrt(12.0)  # annualize monthly downside deviation
     risk = RiskMetrics(
         annualized_vol=sigma,
-        sharpe=(mu/sigma) if sigma>0 else 0,
-        sortino=(mu/sigma) if sigma>0 else 0,  # simplified
-        max_drawdown_mean=0.0,
-        calmar=mu/0.2 if category=="Actions" else mu/0.1
+        sharpe=(mu/sigma) if sigma > 0 else 0.0,
+        sortino=(mu/downside_ann) if downside_ann > 0 else 0.0,
+        max_drawdown_mean=mean_dd,
+        calmar=(mu/mean_dd) if mean_dd > 0 else 0.0,
     )
     return MonteCarloSummary(fund_name, category, years, mu, sigma, annual_fee, tax_rate,
                              total_contributed, n_paths, p5, p50, p95, prob_loss, risk)
 
+# Seeded summaries are deterministic in their inputs, so repeated UI refreshes
+# and A/B comparisons can be served from a small LRU instead of resimulating.
+_mc_summary_cached = lru_cache(maxsize=512)(_monte_carlo_core)
+
 # -----------------------------
 # Demo
 # -----------------------------
@@ -1,9 +1,20 @@
+import asyncio
+from functools import partial
+
 from fastapi import FastAPI
 from pydantic import BaseModel
-from opcvm_simulator import simulate_investment, monte_carlo_simulate
+from opcvm_simulator import simulate_investment, simulate_investments_batch, monte_carlo_simulate
 
 app = FastAPI()
 
+@app.on_event("startup")
+async def _warmup():
+    # Tiny dummy runs so Numba's cached kernels are loaded (and compiled on the
+    # very first deploy) before real traffic arrives, instead of the first
+    # request paying seconds of JIT latency.
+    simulate_investment("ATTIJARI ACTIONS", 1.0, 0.0, 0.1)
+    monte_carlo_simulate("ATTIJARI ACTIONS", 1.0, 0.0, 0.1, n_paths=8, random_seed=0)
+
 class SimulationRequest(BaseModel):
     fund_name: str
     initial_amount: float
@@ -24,15 +35,20 @@ class MonteCarloRequest(BaseModel):
     random_seed: int | None = None
 
 @app.post("/deterministic")
-def simulate(req: SimulationRequest):
-    result = simulate_investment(
+async def simulate(req: SimulationRequest):
+    loop = asyncio.get_running_loop()
+    result = await loop.run_in_executor(None, partial(
+        simulate_investment,
         fund_name=req.fund_name,
         initial_amount=req.initial_amount,
         monthly_contribution=req.monthly_contribution,
         years=req.years,
         annual_fee=req.annual_fee,
         tax_rate=req.tax_rate,
-    )
+    ))
+    return _deterministic_payload(result)
+
+def _deterministic_payload(result):
     return {
         "fund_name": result.fund_name,
         "category": result.category,
@@ -43,18 +59,38 @@ def simulate(req: SimulationRequest):
         "net_profit_after_tax": result.net_profit_after_tax,
         "tax_paid": result.tax_paid,
         "total_contributed": result.total_contributed,
-        "trajectory": [{"month": i+1, "value": v} for i, v in enumerate(result.monthly_trajectory)],
+        # Bare value array: months are implicit (1..n), and the per-month dicts
+        # quadrupled the payload size on long horizons.
+        "trajectory": {"values": result.monthly_trajectory},
     }
 
+@app.post("/deterministic-batch")
+async def simulate_batch(reqs: list[SimulationRequest]):
+    """
+    Evaluate several deterministic simulations in one request.
+
+    Fund comparisons previously needed one /deterministic round-trip per fund;
+    here all trajectories are computed in a single vectorized pass.
+    """
+    loop = asyncio.get_running_loop()
+    results = await loop.run_in_executor(None, simulate_investments_batch,
+                                         [r.model_dump() for r in reqs])
+    return [_deterministic_payload(r) for r in results]
+
 @app.post("/mc-simulate")
-def monte_carlo_simulate_route(req: MonteCarloRequest):
+async def monte_carlo_simulate_route(req: MonteCarloRequest):
     """
     Monte Carlo simulation endpoint for investment analysis.
-    
+
     This endpoint performs Monte Carlo simulation to analyze investment scenarios
     with probabilistic outcomes, including risk metrics and percentile analysis.
     """
-    result = monte_carlo_simulate(
+    # Offloaded to the default threadpool so the event loop stays responsive;
+    # the simulator releases the GIL in its Numba kernel and already spreads
+    # large runs over its own process pool, so no second pool is needed here.
+    loop = asyncio.get_running_loop()
+    result = await loop.run_in_executor(None, partial(
+        monte_carlo_simulate,
         fund_name=req.fund_name,
         initial_amount=req.initial_amount,
         monthly_contribution=req.monthly_contribution,
@@ -64,8 +100,8 @@ def monte_carlo_simulate_route(req: MonteCarloRequest):
         expected_return_override=req.expected_return_override,
         annual_vol_override=req.annual_vol_override,
         random_seed=req.random_seed,
-    )
-    
+    ))
+
     return {
         "fund_name": result.fund_name,
         "category": result.category,
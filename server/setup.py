@@ -0,0 +1,9 @@
+from setuptools import setup
+from Cython.Build import cythonize
+
+# Builds the optional _sim extension (see _sim.pyx):
+#   python setup.py build_ext --inplace
+setup(
+    name="opcvm-simulator-ext",
+    ext_modules=cythonize("_sim.pyx", language_level=3),
+)